@@ -1,6 +1,8 @@
+import collections
 import contextlib
-import json
+import functools
 import os
+import shutil
 import subprocess
 import sys
 import tempfile
@@ -26,6 +28,10 @@ else:
     from typing_extensions import override
 
 
+#: Read buffer for the meltano stdout pipe, large enough to drain a full Linux pipe in one read
+_STDOUT_BUFFER_SIZE = 64 * 1024
+
+
 @dataclass
 class MeltanoProjectArgs(dg.Resolvable):
     """Aligns with MeltanoProject.__new__."""
@@ -98,6 +104,11 @@ def get_all_ssh_keys(pipeline: "MeltanoPipeline") -> list[str]:
     return ssh_keys
 
 
+def _open_private_file(path: str) -> t.TextIO:
+    """Create a new file that is only readable and writable by the owner, without a separate chmod."""
+    return os.fdopen(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), "w")
+
+
 @contextmanager
 def setup_ssh_config(
     context: dg.AssetExecutionContext,
@@ -114,53 +125,43 @@ def setup_ssh_config(
 
     context.log.info("Setting up SSH configuration for Git authentication")
 
-    # Use context managers to ensure files stay open and accessible
+    # The temporary directory is only accessible by the current user, so files can use fixed names
     with tempfile.TemporaryDirectory(prefix="meltano_ssh_") as temp_dir:
-        # Use ExitStack to manage multiple key file contexts properly
-        with contextlib.ExitStack() as stack:
-            key_files = []
-
-            # Create and enter context for each key file
-            for i, key_content in enumerate(ssh_private_keys):
-                # Replace literal \n with actual newlines
-                key_content = key_content.replace("\\n", "\n")
-                if not key_content.endswith("\n"):
-                    key_content += "\n"
-
-                key_file = stack.enter_context(
-                    tempfile.NamedTemporaryFile(mode="w", suffix=f"_id_rsa_{i}", dir=temp_dir, delete=False),
-                )
+        key_files = []
+
+        for i, key_content in enumerate(ssh_private_keys):
+            # Replace literal \n with actual newlines
+            key_content = key_content.replace("\\n", "\n")
+            if not key_content.endswith("\n"):
+                key_content += "\n"
+
+            key_file_path = os.path.join(temp_dir, f"git_id_rsa_{i}")
+            with _open_private_file(key_file_path) as key_file:
                 key_file.write(key_content)
-                key_file.flush()
-                os.chmod(key_file.name, 0o600)
-                key_files.append(key_file.name)
-
-            # Create SSH config file
-            ssh_config_content = []
-            for key_file_path in key_files:
-                ssh_config_content.extend(
-                    [
-                        "Host *",
-                        f"    IdentityFile {key_file_path}",
-                        "    IdentitiesOnly yes",
-                        "    StrictHostKeyChecking no",
-                        "    UserKnownHostsFile /dev/null",
-                        "",
-                    ],
-                )
-
-            ssh_config_file = tempfile.NamedTemporaryFile(mode="w", suffix="_ssh_config", dir=temp_dir, delete=False)
-            ssh_config_file.write("\n".join(ssh_config_content))
-            ssh_config_file.close()
-
-            yield ssh_config_file.name
+            key_files.append(key_file_path)
+
+        # Create SSH config file
+        ssh_config_content = "\n".join(
+            "Host *\n"
+            f"    IdentityFile {key_file_path}\n"
+            "    IdentitiesOnly yes\n"
+            "    StrictHostKeyChecking no\n"
+            "    UserKnownHostsFile /dev/null\n"
+            for key_file_path in key_files
+        )
+
+        ssh_config_path = os.path.join(temp_dir, "git_ssh_config")
+        with _open_private_file(ssh_config_path) as ssh_config_file:
+            ssh_config_file.write(ssh_config_content)
+
+        yield ssh_config_path
 
 
 def build_pipeline_env(
     pipeline: "MeltanoPipeline",
     project: MeltanoProject,
     ssh_config_path: str | None = None,
-    base_env: dict[str, str] | None = None,
+    base_env: t.Mapping[str, str] | None = None,
     flags: t.Optional["MeltanoRunConfig"] = None,
 ) -> dict[str, str]:
     """Build environment variables for the Meltano pipeline.
@@ -174,26 +175,22 @@ def build_pipeline_env(
     Returns:
         Dictionary of environment variables for the pipeline
     """
-    base_env = dict(os.environ) if base_env is None else dict(base_env)
+    # Copy the base environment once and overlay pipeline-specific variables in place
+    env = dict(os.environ if base_env is None else base_env)
 
     # Prevent MELTANO_PROJECT_ROOT from interfering with configured project location
-    base_env.pop("MELTANO_PROJECT_ROOT", None)
+    env.pop("MELTANO_PROJECT_ROOT", None)
 
     # Add meltano config if present
     if pipeline.meltano_config:
-        base_env.update(pipeline.meltano_config.as_env())
-
-    # Build final environment with all pipeline-specific variables
-    env = {
-        **base_env,
-        **pipeline.extractor.as_env(),
-        **pipeline.loader.as_env(),
-        **pipeline.env,
-    }
+        env.update(pipeline.meltano_config.as_env())
+
+    env.update(pipeline.extractor.as_env())
+    env.update(pipeline.loader.as_env())
+    env.update(pipeline.env)
 
     # Set JSON log format as default if not already configured
-    if "MELTANO_CLI_LOG_FORMAT" not in env:
-        env["MELTANO_CLI_LOG_FORMAT"] = "json"
+    env.setdefault("MELTANO_CLI_LOG_FORMAT", "json")
 
     # Add SSH config if provided
     if ssh_config_path:
@@ -201,8 +198,7 @@ def build_pipeline_env(
 
     # Add select_filter if provided in runtime config
     if flags and flags.select_filter is not None:
-        extractor_name = pipeline.extractor.name.upper().replace("-", "_")
-        env[f"{extractor_name}__SELECT_FILTER"] = json.dumps(flags.select_filter)
+        env[f"{pipeline.extractor.env_prefix}__SELECT_FILTER"] = orjson.dumps(flags.select_filter).decode()
 
     return env
 
@@ -225,49 +221,101 @@ def process_meltano_stdout(
     duration_seconds: float | None = None
 
     for line in lines:
-        try:
-            log_data = orjson.loads(line)
-        except orjson.JSONDecodeError:
+        log_data: dict[str, t.Any] | None = None
+
+        # Meltano log records are JSON objects, so only lines that look like one are parsed.
+        # This avoids raising and catching a decode error for every plain-text line.
+        if line.startswith(b"{"):
+            with contextlib.suppress(orjson.JSONDecodeError):
+                log_data = orjson.loads(line)
+
+        if log_data is None:
             # If it's not valid JSON, log as raw text
-            decoded_line = line.decode("utf-8").strip()
+            decoded_line = line.decode("utf-8", errors="replace").strip()
+            if not decoded_line:
+                continue
+
             context.log.info(decoded_line)
             # Collect non-JSON error output as well
             if decoded_line.lower().find("error") != -1:
                 error_logs.append(decoded_line)
-        else:
-            level = log_data.pop("level")
-            event = log_data.pop("event")
-
-            if event.startswith("METRIC"):
-                if metric_info := log_data.pop("metric_info", None):
-                    context.log.debug(_format_metric_info(metric_info))
-                else:
-                    # Fallback to logging the raw metric event, e.g. 'METRIC: {"metric_type": ...}'
-                    context.log.debug(event)
+            continue
+
+        # The parsed record is owned by this iteration, so read fields without copying it
+        level = log_data["level"]
+        event = log_data["event"]
+
+        if event.startswith("METRIC"):
+            # Metric details are logged here, so they are not kept in collected records
+            if metric_info := log_data.pop("metric_info", None):
+                context.log.debug(_format_metric_info(metric_info))
             else:
-                context.log.log(level, event)
-
-            # Collect error-level logs for exception context
-            if level == "error":
-                error_context = {"level": level, "event": event, **log_data}
-                error_logs.append(error_context)
-
-            # Collect warning-level logs for asset metadata
-            if level == "warning":
-                warning_context = {"level": level, "event": event, **log_data}
-                warning_logs.append(warning_context)
-
-            if "Run completed" in event:
-                duration_seconds = log_data.pop("duration_seconds", None)
-                context.add_asset_metadata(
-                    {
-                        "duration_seconds": duration_seconds,
-                    },
-                )
+                # Fallback to logging the raw metric event, e.g. 'METRIC: {"metric_type": ...}'
+                context.log.debug(event)
+        else:
+            context.log.log(level, event)
+
+        # Collect error-level logs for exception context
+        if level == "error":
+            error_logs.append(log_data)
+
+        # Collect warning-level logs for asset metadata
+        elif level == "warning":
+            warning_logs.append(log_data)
+
+        if "Run completed" in event:
+            duration_seconds = log_data.get("duration_seconds")
+            context.add_asset_metadata(
+                {
+                    "duration_seconds": duration_seconds,
+                },
+            )
 
     return RunResult(error_logs, warning_logs, duration_seconds)
 
 
+@functools.cache
+def _package_version(distribution_name: str) -> str:
+    """Get the installed version of a distribution, reading its metadata only once."""
+    return version(distribution_name)
+
+
+@functools.cache
+def _find_executable(name: str, path: str | None) -> str | None:
+    """Resolve an executable to an absolute path, searching the given PATH value.
+
+    Relative and unresolved matches return None, leaving the lookup to the OS. Results are cached for the life of
+    the process, so a stale path is possible if the executable moves; _spawn_meltano clears the cache and retries.
+    """
+    executable = shutil.which(name, path=path)
+    if executable is None or not os.path.isabs(executable):
+        return None
+    return executable
+
+
+def _spawn_meltano(args: list[str], *, cwd: str | os.PathLike[str], env: dict[str, str]) -> "subprocess.Popen[bytes]":
+    """Start a Meltano command, resolving its executable against the PATH of the given environment."""
+
+    def popen() -> "subprocess.Popen[bytes]":
+        return subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            executable=_find_executable(args[0], env.get("PATH")),
+            cwd=cwd,
+            env=env,
+            text=False,
+            bufsize=_STDOUT_BUFFER_SIZE,
+        )
+
+    try:
+        return popen()
+    except FileNotFoundError:
+        # The cached executable may have moved, look it up again
+        _find_executable.cache_clear()
+        return popen()
+
+
 def _run_meltano_pipeline(
     context: dg.AssetExecutionContext,
     pipeline: "MeltanoPipeline",
@@ -281,23 +329,19 @@ def _run_meltano_pipeline(
 
     context.add_asset_metadata(
         {
-            "meltano_version": version("meltano"),
-            "component_version": version("dagster-meltano-pipelines"),
+            "meltano_version": _package_version("meltano"),
+            "component_version": _package_version("dagster-meltano-pipelines"),
         },
     )
 
-    process = subprocess.Popen(
+    process = _spawn_meltano(
         [
             *command,
             pipeline.extractor.name,
             pipeline.loader.name,
         ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
         cwd=project.project_dir,
         env=env,
-        text=False,
-        bufsize=1,
     )
 
     # Stream logs in real time
@@ -340,11 +384,9 @@ def pipeline_to_dagster_asset(
     tags: dict[str, str] = {
         "extractor": pipeline.extractor.name,
         "loader": pipeline.loader.name,
+        **(props.tags or {}),
+        **(pipeline.tags or {}),
     }
-    if props.tags:
-        tags.update(props.tags)
-    if pipeline.tags:
-        tags.update(pipeline.tags)
 
     @dg.asset(
         name=pipeline.id,
@@ -361,11 +403,11 @@ def pipeline_to_dagster_asset(
         context.log.info("Running pipeline: %s", pipeline.id)
 
         # Log warning if MELTANO_PROJECT_ROOT was removed
-        if "MELTANO_PROJECT_ROOT" in os.environ:
+        if (meltano_project_root := os.environ.get("MELTANO_PROJECT_ROOT")) is not None:
             context.log.warning(
                 "Removing MELTANO_PROJECT_ROOT environment variable (value: %s) to prevent "
                 "interference with configured project directory: %s",
-                os.environ["MELTANO_PROJECT_ROOT"],
+                meltano_project_root,
                 project.project_dir,
             )
 
@@ -409,12 +451,7 @@ class MeltanoRunConfig(dg.Config):
         if self.log_level:
             command.append(f"--log-level={self.log_level}")
 
-        command.extend(
-            [
-                "run",
-                f"--run-id={run_id}",
-            ],
-        )
+        command += ("run", f"--run-id={run_id}")
 
         if state_suffix:
             command.append(f"--state-id-suffix={state_suffix}")
@@ -480,22 +517,19 @@ class MeltanoPipelineComponent(dg.Component, dg.Resolvable):
 
     @override
     def build_defs(self, context: dg.ComponentLoadContext) -> dg.Definitions:
-        assets = []
-        seen_ids = set()
-
-        for pipeline in self.pipelines:
-            if pipeline.id in seen_ids:
-                msg = f"Pipeline ID {pipeline.id} is not unique"
-                raise ValueError(msg)
-
-            seen_ids.add(pipeline.id)
-
-            assets.append(
-                pipeline_to_dagster_asset(
-                    pipeline,
-                    project=self.project,
-                    props=self.asset_props,
-                ),
+        # Validate all pipeline IDs up front, before any asset is built
+        pipeline_ids = collections.Counter(pipeline.id for pipeline in self.pipelines)
+        if duplicate_ids := [pipeline_id for pipeline_id, count in pipeline_ids.items() if count > 1]:
+            msg = f"Pipeline IDs are not unique: {', '.join(duplicate_ids)}"
+            raise ValueError(msg)
+
+        assets = [
+            pipeline_to_dagster_asset(
+                pipeline,
+                project=self.project,
+                props=self.asset_props,
             )
+            for pipeline in self.pipelines
+        ]
 
         return dg.Definitions(assets=assets)
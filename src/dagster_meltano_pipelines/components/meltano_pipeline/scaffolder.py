@@ -5,6 +5,11 @@ import yaml
 from meltano.cli import cli as meltano_cli  # type: ignore[attr-defined]
 from pydantic import BaseModel
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper  # type: ignore[assignment]
+
 
 class MeltanoScaffolderParams(BaseModel):
     project_path: Path | None = None
@@ -69,4 +74,4 @@ class MeltanoProjectScaffolder(dg.Scaffolder[MeltanoScaffolderParams]):
         }
 
         with open(logging_yaml_path, "w") as f:
-            yaml.dump(logging_config, f, default_flow_style=False)
+            yaml.dump(logging_config, f, Dumper=SafeDumper, default_flow_style=False)
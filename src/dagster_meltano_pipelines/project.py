@@ -1,35 +1,111 @@
-import json
+import copy
+import functools
+import os
 import typing as t
 from pathlib import Path
 
+import orjson
 import yaml
 from dagster._record import IHaveNew, record_custom
 
 from dagster_meltano_pipelines.errors import DagsterMeltanoProjectNotFoundError
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
 
-def _read_meltano_yml_plugin_defs(
+
+@functools.lru_cache(maxsize=128)
+def _load_yaml_file(path: Path, mtime_ns: int, size: int) -> t.Any:
+    # The modification time and size are only part of the cache key, so that edited files are parsed again
+    with open(path) as file:
+        return yaml.load(file, Loader=SafeLoader)
+
+
+def _read_yaml_file(path: Path) -> t.Any:
+    """Read a YAML file, reusing the parsed document while the file is unchanged.
+
+    The returned document is shared between callers and must not be mutated.
+    """
+    stat = path.stat()
+    return _load_yaml_file(path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=512)
+def _load_lock_file(path: str, mtime_ns: int, size: int) -> dict[str, t.Any]:
+    # The modification time and size are only part of the cache key, so that updated locks are parsed again
+    with open(path, "rb") as file:
+        return orjson.loads(file.read())  # type: ignore[no-any-return]
+
+
+def _read_lock_file(path: str) -> dict[str, t.Any]:
+    """Read a plugin lock file, reusing the parsed definition while the file is unchanged.
+
+    The returned definition is shared between callers and must not be mutated.
+    """
+    stat = os.stat(path)
+    return _load_lock_file(path, stat.st_mtime_ns, stat.st_size)
+
+
+#: A plugin's meltano.yml entry and the path of its lock file (None for custom plugins with inlined definitions)
+_PluginRef: t.TypeAlias = tuple[dict[str, t.Any], str | None]
+
+
+def _read_meltano_yml_plugin_refs(
     meltano_yml: dict[str, t.Any],
     project_dir: Path,
-) -> dict[tuple[str, str], dict[str, t.Any]]:
-    plugin_defs: dict[tuple[str, str], dict[str, t.Any]] = {}
+) -> dict[tuple[str, str], _PluginRef]:
+    plugin_refs: dict[tuple[str, str], _PluginRef] = {}
+    plugins_dir = os.path.join(project_dir, "plugins")
     for plugin_type, plugins in meltano_yml.get("plugins", {}).items():
         for plugin in plugins:
             if plugin.get("namespace") or plugin.get("inherit_from"):
                 # This is a custom plugin, the definition is inlined
-                plugin_defs[plugin_type, plugin["name"]] = plugin
+                plugin_refs[plugin_type, plugin["name"]] = (plugin, None)
             else:
                 # Read from $project_dir/plugins/$plugin_type/$plugin_name--$plugin_variant.lock
-                plugin_lock_file = project_dir.joinpath(
-                    "plugins",
-                    plugin_type,
-                    f"{plugin['name']}--{plugin['variant']}.lock",
-                )
-                with open(plugin_lock_file) as file:
-                    plugin_def = json.load(file)
-                plugin_defs[plugin_type, plugin["name"]] = {**plugin_def, **plugin}
+                plugin_lock_file = os.path.join(plugins_dir, plugin_type, f"{plugin['name']}--{plugin['variant']}.lock")
+                plugin_refs[plugin_type, plugin["name"]] = (plugin, plugin_lock_file)
 
-    return plugin_defs
+    return plugin_refs
+
+
+class MeltanoPluginDefinitions(t.Mapping[tuple[str, str], dict[str, t.Any]]):
+    """Plugin definitions keyed by plugin type and name, reading each lock file on first access."""
+
+    def __init__(self, plugin_refs: dict[tuple[str, str], _PluginRef]) -> None:
+        self._plugin_refs = plugin_refs
+        self._plugin_defs: dict[tuple[str, str], dict[str, t.Any]] = {}
+
+    def __getitem__(self, key: tuple[str, str]) -> dict[str, t.Any]:
+        if (plugin_def := self._plugin_defs.get(key)) is not None:
+            return plugin_def
+
+        plugin, plugin_lock_file = self._plugin_refs[key]
+        # Deep copy the merged definition, since the parsed YAML and lock files are cached and shared between projects
+        lock_def = _read_lock_file(plugin_lock_file) if plugin_lock_file is not None else {}
+        plugin_def = copy.deepcopy({**lock_def, **plugin})
+
+        return self._plugin_defs.setdefault(key, plugin_def)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._plugin_refs
+
+    def __eq__(self, other: object) -> bool:
+        # Compare the meltano.yml entries and lock file paths, so that comparing projects reads no lock files
+        if isinstance(other, MeltanoPluginDefinitions):
+            return self._plugin_refs == other._plugin_refs
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._plugin_refs)!r})"
+
+    def __iter__(self) -> t.Iterator[tuple[str, str]]:
+        return iter(self._plugin_refs)
+
+    def __len__(self) -> int:
+        return len(self._plugin_refs)
 
 
 @record_custom
@@ -37,7 +113,7 @@ class MeltanoProject(IHaveNew):
     """A component that represents a Meltano project."""
 
     project_dir: Path
-    plugins: dict[tuple[str, str], dict[str, t.Any]]
+    plugins: MeltanoPluginDefinitions
 
     def __new__(
         cls,
@@ -48,20 +124,17 @@ class MeltanoProject(IHaveNew):
             msg = f"project_dir {project_dir} does not exist."
             raise DagsterMeltanoProjectNotFoundError(msg)
 
-        with open(project_dir.joinpath("meltano.yml")) as file:
-            meltano_yml = yaml.safe_load(file)
+        meltano_yml = _read_yaml_file(project_dir.joinpath("meltano.yml"))
 
-        plugin_defs: dict[tuple[str, str], dict[str, t.Any]] = _read_meltano_yml_plugin_defs(meltano_yml, project_dir)
+        plugin_refs = _read_meltano_yml_plugin_refs(meltano_yml, project_dir)
 
         # Merge with `include_paths`:
         for include_path in meltano_yml.get("include_paths", []):
-            with open(project_dir.joinpath(include_path)) as file:
-                include_meltano_yml = yaml.safe_load(file)
-
-            plugin_defs.update(_read_meltano_yml_plugin_defs(include_meltano_yml, project_dir))
+            include_meltano_yml = _read_yaml_file(project_dir.joinpath(include_path))
+            plugin_refs.update(_read_meltano_yml_plugin_refs(include_meltano_yml, project_dir))
 
         return super().__new__(
             cls,
             project_dir=project_dir,
-            plugins=plugin_defs,
+            plugins=MeltanoPluginDefinitions(plugin_refs),
         )
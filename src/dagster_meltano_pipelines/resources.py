@@ -1,10 +1,10 @@
-import abc
 import collections.abc
+import functools
 import json
-from collections.abc import Sequence
-from typing import Any, Literal
+from typing import Any, ClassVar, Literal
 
 import dagster as dg
+import orjson
 from pydantic import Field
 
 
@@ -15,6 +15,23 @@ class MeltanoPluginConfig(dg.PermissiveConfig):
         kwargs.setdefault("by_alias", True)
         return super().model_dump(*args, **kwargs)
 
+    @classmethod
+    @functools.cache
+    def _env_suffixes(cls) -> dict[str, str]:
+        """Environment variable suffixes of the declared fields (the upper-cased alias), keyed by field name."""
+        return {name: (field.alias or name).upper() for name, field in cls.model_fields.items()}
+
+    def _env_items(self) -> collections.abc.Iterator[tuple[str, Any]]:
+        """Yield the environment variable suffix and value of each non-null setting, without dumping the model."""
+        for name, suffix in self._env_suffixes().items():
+            value = getattr(self, name)
+            if value is not None:
+                yield suffix, value
+
+        for key, value in (self.model_extra or {}).items():
+            if value is not None:
+                yield key.upper(), value
+
 
 class ExtractorConfig(MeltanoPluginConfig):
     """Extractor configuration."""
@@ -74,28 +91,27 @@ class MeltanoPlugin(dg.ConfigurableResource["MeltanoPlugin"]):
         description="SSH private key content for Git authentication",
     )
 
+    @property
+    def env_prefix(self) -> str:
+        """The environment variable prefix."""
+        return self.name.upper().replace("-", "_")
+
     def as_env(self) -> dict[str, str]:
         """Convert the plugin configuration to a dictionary of environment variables."""
         env: dict[str, str] = {}
         if not self.config:
             return env
 
-        prefix = self.name.upper().replace("-", "_")
-
-        for key, value in self.config.model_dump().items():
-            suffix = key.upper()
+        prefix = self.env_prefix
 
+        for suffix, value in self.config._env_items():
             # Retrieve the value from the environment variable
             if isinstance(value, dg.EnvVar):
                 value = value.get_value()
 
-            # Convert sequence values to JSON strings after resolving environment variables
-            elif isinstance(value, (list, tuple)):
-                value = json.dumps(_resolve_sequence(value))
-
-            # Convert object values to JSON strings
-            elif isinstance(value, collections.abc.Mapping):
-                value = json.dumps(_resolve_mapping(value))
+            # Convert sequence and object values to JSON strings, resolving environment variables
+            elif isinstance(value, (list, tuple, collections.abc.Mapping)):
+                value = _json_dumps(value)
 
             if value is not None:
                 env[f"{prefix}_{suffix}"] = str(value)
@@ -113,6 +129,55 @@ class Loader(MeltanoPlugin):
     """Loader."""
 
 
+def _resolve_json_default(value: Any) -> Any:
+    """Resolve values that orjson does not serialize natively (or passes through as subclasses)."""
+    if isinstance(value, dg.EnvVar):
+        return value.get_value()
+    # Other subclasses of builtin types are passed through too, serialize them as their base type
+    if isinstance(value, str):
+        return str(value)
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float):
+        return float(value)
+    if isinstance(value, collections.abc.Mapping):
+        return dict(value)
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    raise TypeError
+
+
+def _resolve_env_vars(value: Any) -> Any:
+    """Resolve nested environment variables for the stdlib encoder, which serializes EnvVar as its name."""
+    if isinstance(value, dg.EnvVar):
+        return value.get_value()
+    if isinstance(value, collections.abc.Mapping):
+        return {k: _resolve_env_vars(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_resolve_env_vars(v) for v in value]
+    return value
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a value to a JSON string, resolving nested environment variables in the same pass."""
+    try:
+        encoded = orjson.dumps(
+            value,
+            default=_resolve_json_default,
+            # EnvVar is a str subclass, so subclasses must be passed to the default hook instead of serialized as-is
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_SUBCLASS,
+        )
+    except orjson.JSONEncodeError:
+        # orjson rejects integers beyond 64 bits, which the stdlib encoder handles
+        encoded = None
+
+    # orjson also writes NaN and Infinity as null, so any null is checked again by the stdlib encoder
+    if encoded is None or b"null" in encoded:
+        return json.dumps(_resolve_env_vars(value), ensure_ascii=False, separators=(",", ":"))
+
+    return encoded.decode()
+
+
 def _dict_to_env(value: collections.abc.Mapping[str, Any], *, prefix: str | None = None) -> dict[str, str]:
     env: dict[str, str] = {}
     for k, v in value.items():
@@ -120,7 +185,7 @@ def _dict_to_env(value: collections.abc.Mapping[str, Any], *, prefix: str | None
         if isinstance(v, dg.EnvVar):
             v = v.get_value()
         elif isinstance(v, (list, tuple)):
-            v = json.dumps(_resolve_sequence(v))
+            v = _json_dumps(v)
         elif isinstance(v, collections.abc.Mapping):
             env |= _dict_to_env(v, prefix=key)
             continue
@@ -131,49 +196,17 @@ def _dict_to_env(value: collections.abc.Mapping[str, Any], *, prefix: str | None
     return env
 
 
-def _resolve_mapping(value: collections.abc.Mapping[str, Any]) -> dict[str, Any]:
-    """Resolve a mapping to a dictionary of environment variables."""
-    result: dict[str, Any] = {}
-    for k, v in value.items():
-        if isinstance(v, dg.EnvVar):
-            result[k] = v.get_value()
-        elif isinstance(v, (list, tuple)):
-            result[k] = _resolve_sequence(v)
-        elif isinstance(v, collections.abc.Mapping):
-            result[k] = _resolve_mapping(v)
-        else:
-            result[k] = v
-    return result
-
-
-def _resolve_sequence(value: Sequence[Any]) -> list[Any]:
-    """Resolve a sequence to a list."""
-    result: list[Any] = []
-    for item in value:
-        if isinstance(item, dg.EnvVar):
-            result.append(item.get_value())
-        elif isinstance(item, (list, tuple)):
-            result.append(_resolve_sequence(item))
-        elif isinstance(item, collections.abc.Mapping):
-            result.append(_resolve_mapping(item))
-        else:
-            result.append(item)
-
-    return result
-
-
 class AsEnv(dg.PermissiveConfig):
     """Mixin for converting the configuration to a dictionary of environment variables."""
 
-    @property
-    @abc.abstractmethod
-    def env_prefix(self) -> str:
-        """The environment variable prefix."""
-        ...
+    #: The environment variable prefix.
+    env_prefix: ClassVar[str]
 
     def as_env(self) -> dict[str, str]:
         """Convert the configuration to a dictionary of environment variables."""
-        return _dict_to_env(self.model_dump(), prefix=self.env_prefix)
+        # Read the fields directly rather than dumping the model, null values are skipped by _dict_to_env
+        values = {name: getattr(self, name) for name in type(self).model_fields}
+        return _dict_to_env(values | (self.model_extra or {}), prefix=self.env_prefix)
 
 
 class StateBackendConfig(AsEnv):
@@ -181,10 +214,7 @@ class StateBackendConfig(AsEnv):
 
     uri: str = Field(description="State backend URI")
 
-    @property
-    def env_prefix(self) -> str:
-        """The environment variable prefix."""
-        return "STATE_BACKEND"
+    env_prefix: ClassVar[str] = "STATE_BACKEND"
 
 
 class VenvConfig(AsEnv):
@@ -192,10 +222,7 @@ class VenvConfig(AsEnv):
 
     backend: Literal["virtualenv", "uv"] = Field(description="Virtual Environment backend")
 
-    @property
-    def env_prefix(self) -> str:
-        """The environment variable prefix."""
-        return "VENV"
+    env_prefix: ClassVar[str] = "VENV"
 
 
 class CLIConfig(AsEnv):
@@ -204,10 +231,7 @@ class CLIConfig(AsEnv):
     log_level: Literal["debug", "info", "warning", "error", "critical"] | None = Field(description="Log level")
     log_format: Literal["json", "text"] | None = Field(description="Log format")
 
-    @property
-    def env_prefix(self) -> str:
-        """The environment variable prefix."""
-        return "CLI"
+    env_prefix: ClassVar[str] = "CLI"
 
 
 class ELTConfig(AsEnv):
@@ -215,10 +239,7 @@ class ELTConfig(AsEnv):
 
     buffer_size: int | None = Field(description="Buffer size")
 
-    @property
-    def env_prefix(self) -> str:
-        """The environment variable prefix."""
-        return "ELT"
+    env_prefix: ClassVar[str] = "ELT"
 
 
 class MeltanoConfig(AsEnv):
@@ -229,39 +250,27 @@ class MeltanoConfig(AsEnv):
     cli: CLIConfig | None = Field(default=None, description="CLI configuration")
     elt: ELTConfig | None = Field(default=None, description="ELT configuration")
 
-    @property
-    def env_prefix(self) -> str:
-        """The environment variable prefix."""
-        return "MELTANO"
+    env_prefix: ClassVar[str] = "MELTANO"
 
     def as_env(self) -> dict[str, str]:
         """Convert the plugin configuration to a dictionary of environment variables."""
         env: dict[str, str] = {}
-        if self.state_backend:
-            for key, value in self.state_backend.as_env().items():
-                env[f"{self.env_prefix}_{key}"] = value
-
-        if self.venv:
-            for key, value in self.venv.as_env().items():
-                env[f"{self.env_prefix}_{key}"] = value
-
-        if self.cli:
-            for key, value in self.cli.as_env().items():
-                env[f"{self.env_prefix}_{key}"] = value
+        prefix = self.env_prefix
 
-        if self.elt:
-            for key, value in self.elt.as_env().items():
-                env[f"{self.env_prefix}_{key}"] = value
+        for section in (self.state_backend, self.venv, self.cli, self.elt):
+            if section is not None:
+                env.update((f"{prefix}_{key}", value) for key, value in section.as_env().items())
 
-        for key, value in self.model_dump(exclude={"state_backend", "venv", "cli", "elt"}).items():
+        # Every declared field is a section, so the remaining settings are the extras
+        for key, value in (self.model_extra or {}).items():
             suffix = key.upper()
             if isinstance(value, dg.EnvVar):
-                value = value.get_value()  # type: ignore[assignment]
+                value = value.get_value()
 
             elif isinstance(value, (collections.abc.Mapping, list, tuple)):
-                value = json.dumps(value)
+                value = _json_dumps(value)
 
             if value is not None:
-                env[f"{self.env_prefix}_{suffix}"] = str(value)
+                env[f"{prefix}_{suffix}"] = str(value)
 
         return env
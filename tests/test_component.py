@@ -0,0 +1,113 @@
+import os
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import Mock
+
+import dagster as dg
+import pytest
+
+from dagster_meltano_pipelines.components.meltano_pipeline.component import (
+    DagsterAssetProps,
+    MeltanoPipeline,
+    MeltanoPipelineComponent,
+    _find_executable,
+    _spawn_meltano,
+    pipeline_to_dagster_asset,
+)
+from dagster_meltano_pipelines.project import MeltanoProject
+from dagster_meltano_pipelines.resources import Extractor, Loader
+
+
+def _pipeline(pipeline_id: str) -> MeltanoPipeline:
+    return MeltanoPipeline(
+        id=pipeline_id,
+        extractor=Extractor(name="tap-test", config=None),
+        loader=Loader(name="target-test", config=None),
+        meltano_config=None,
+        state_suffix=None,
+    )
+
+
+def test_build_defs_rejects_duplicate_pipeline_ids() -> None:
+    """Test that duplicate pipeline IDs are reported before any asset is built."""
+    project = Mock(spec=MeltanoProject)
+    component = MeltanoPipelineComponent(
+        project=project,
+        pipelines=[_pipeline("a"), _pipeline("b"), _pipeline("a"), _pipeline("b"), _pipeline("c")],
+    )
+
+    with pytest.raises(ValueError, match="Pipeline IDs are not unique: a, b"):
+        component.build_defs(Mock(spec=dg.ComponentLoadContext))
+
+
+def test_pipeline_to_dagster_asset_tags() -> None:
+    """Test that pipeline tags take precedence over component-wide and default tags."""
+    project = Mock(spec=MeltanoProject)
+    project.plugins = {
+        ("extractors", "tap-test"): {"name": "tap-test"},
+        ("loaders", "target-test"): {"name": "target-test"},
+    }
+    pipeline = _pipeline("test-pipeline")
+    pipeline.tags = {"team": "data", "loader": "overridden"}
+    props = DagsterAssetProps(tags={"team": "platform", "env": "dev"})
+
+    asset = pipeline_to_dagster_asset(pipeline, project=project, props=props)
+
+    assert asset.tags_by_key[dg.AssetKey("test-pipeline")] == {
+        "extractor": "tap-test",
+        "loader": "overridden",
+        "team": "data",
+        "env": "dev",
+        "dagster/kind/Meltano": "",
+    }
+
+
+@pytest.fixture
+def meltano_bin(tmp_path: Path) -> Iterator[Path]:
+    """Create a directory with a `meltano` stub, a link to the Python interpreter so it can report its argv[0]."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "meltano").symlink_to(os.path.realpath(sys.executable))
+
+    _find_executable.cache_clear()
+    yield bin_dir
+    _find_executable.cache_clear()
+
+
+def test_find_executable_searches_given_path(meltano_bin: Path) -> None:
+    assert _find_executable("meltano", str(meltano_bin)) == str(meltano_bin / "meltano")
+
+
+def test_find_executable_ignores_relative_matches(meltano_bin: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(meltano_bin.parent)
+    assert _find_executable("meltano", "bin") is None
+
+
+def test_find_executable_missing(meltano_bin: Path, tmp_path: Path) -> None:
+    assert _find_executable("meltano", str(tmp_path)) is None
+
+
+def test_spawn_meltano_keeps_argv0(meltano_bin: Path, tmp_path: Path) -> None:
+    """Test that the resolved executable is run with `meltano` as argv[0]."""
+    env = {"PATH": str(meltano_bin)}
+    process = _spawn_meltano(["meltano", "-c", "import sys; print(sys.orig_argv[0])"], cwd=tmp_path, env=env)
+    stdout, _ = process.communicate()
+
+    assert process.returncode == 0
+    assert stdout == b"meltano\n"
+
+
+def test_spawn_meltano_retries_moved_executable(meltano_bin: Path, tmp_path: Path) -> None:
+    """Test that a stale cached executable path is resolved again."""
+    new_bin = tmp_path / "new-bin"
+    new_bin.mkdir()
+    env = {"PATH": f"{meltano_bin}{os.pathsep}{new_bin}"}
+    assert _find_executable("meltano", env["PATH"]) == str(meltano_bin / "meltano")
+
+    (meltano_bin / "meltano").rename(new_bin / "meltano")
+    process = _spawn_meltano(["meltano", "-c", "pass"], cwd=tmp_path, env=env)
+    process.communicate()
+
+    assert process.returncode == 0
+    assert _find_executable("meltano", env["PATH"]) == str(new_bin / "meltano")
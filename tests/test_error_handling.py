@@ -1,39 +1,128 @@
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
+from unittest.mock import Mock
 
 import dagster as dg
+import orjson
+import pytest
 
+from dagster_meltano_pipelines.components.meltano_pipeline import component
+from dagster_meltano_pipelines.components.meltano_pipeline.component import (
+    MeltanoPipeline,
+    MeltanoRunConfig,
+    _run_meltano_pipeline,
+)
+from dagster_meltano_pipelines.project import MeltanoProject
+from dagster_meltano_pipelines.resources import Extractor, Loader
 
-def test_failure_basic() -> None:
-    """Test basic Failure functionality with metadata."""
-    metadata: dict[str, Any] = {
-        "exit_code": 1,
-        "error_log_count": 0,
-    }
 
+@pytest.mark.parametrize(
+    ("metadata", "description"),
+    [
+        pytest.param(
+            {
+                "exit_code": 1,
+                "error_log_count": 0,
+            },
+            "Meltano job failed with exit code 1",
+            id="basic",
+        ),
+        pytest.param(
+            {
+                "exit_code": 2,
+                "error_logs": [
+                    "Connection failed to database",  # Raw text error
+                    {"level": "ERROR", "event": "Extractor failed", "code": 500},  # Structured error
+                    "Authentication error",  # Raw text error
+                ],
+            },
+            "Meltano job failed with exit code 2",
+            id="with-logs",
+        ),
+    ],
+)
+def test_failure(metadata: dict[str, Any], description: str) -> None:
+    """Test Failure functionality with metadata, including error logs."""
     error = dg.Failure(
-        description="Meltano job failed with exit code 1",
+        description=description,
         metadata=metadata,
     )
 
-    assert "Meltano job failed with exit code 1" in str(error)
+    assert description in str(error)
 
 
-def test_failure_with_logs() -> None:
-    """Test Failure with error logs in metadata as JSON."""
-    error_logs = [
-        "Connection failed to database",  # Raw text error
-        {"level": "ERROR", "event": "Extractor failed", "code": 500},  # Structured error
-        "Authentication error",  # Raw text error
-    ]
+@dataclass
+class _FakeProcess:
+    """Stand-in for the meltano subprocess, replaying its stdout and exit code."""
 
-    metadata: dict[str, Any] = {
-        "exit_code": 2,
-        "error_logs": error_logs[-5:],
-    }
+    lines: list[bytes]
+    exit_code: int
+    stdout: Iterator[bytes] = field(init=False)
 
-    error = dg.Failure(
-        description="Meltano job failed with exit code 2",
-        metadata=metadata,
+    def __post_init__(self) -> None:
+        self.stdout = iter(self.lines)
+
+    def wait(self) -> int:
+        return self.exit_code
+
+
+def _log_line(**record: Any) -> bytes:
+    return orjson.dumps(record) + b"\n"
+
+
+@pytest.mark.parametrize(
+    ("lines", "expected_metadata"),
+    [
+        pytest.param(
+            [
+                _log_line(level="warning", event="Deprecated setting"),
+                _log_line(level="error", event="Extractor failed", plugin="tap-test"),
+                _log_line(level="info", event="Run completed", duration_seconds=12.5),
+            ],
+            {
+                "exit_code": 1,
+                "message": "Extractor failed",
+                "error_logs": [{"level": "error", "event": "Extractor failed", "plugin": "tap-test"}],
+                "warning_logs": [{"level": "warning", "event": "Deprecated setting"}],
+                "duration_seconds": 12.5,
+            },
+            id="run-metadata",
+        ),
+        pytest.param(
+            [b"Connection error\n"],
+            {
+                "exit_code": 1,
+                "message": None,
+                "error_logs": ["Connection error"],
+                "warning_logs": [],
+            },
+            id="run-metadata-without-structured-logs",
+        ),
+    ],
+)
+def test_run_meltano_pipeline_failure_metadata(
+    lines: list[bytes],
+    expected_metadata: dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test the Failure raised when the meltano process exits with an error."""
+    monkeypatch.setattr(component, "_spawn_meltano", lambda *args, **kwargs: _FakeProcess(lines, exit_code=1))
+    context = Mock(spec=dg.AssetExecutionContext)
+    context.run_id = "test-run-123"
+    project = Mock(spec=MeltanoProject)
+    project.project_dir = tmp_path
+    pipeline = MeltanoPipeline(
+        id="test-pipeline",
+        extractor=Extractor(name="tap-test", config=None),
+        loader=Loader(name="target-test", config=None),
+        meltano_config=None,
+        state_suffix=None,
     )
 
-    assert "Meltano job failed with exit code 2" in str(error)
+    with pytest.raises(dg.Failure, match="Meltano job failed with exit code 1") as exc_info:
+        _run_meltano_pipeline(context, pipeline, project, env={}, flags=MeltanoRunConfig())
+
+    assert {key: value.value for key, value in exc_info.value.metadata.items()} == expected_metadata
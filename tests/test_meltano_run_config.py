@@ -1,7 +1,18 @@
+import typing as t
+
 import pytest
 
 from dagster_meltano_pipelines.components.meltano_pipeline.component import MeltanoRunConfig
 
+#: The run subcommand and run ID shared by the expected commands, built once at import
+_RUN_ARGS = ("run", "--run-id=test-run-123")
+
+#: Every supported log level with its expected command
+_LOG_LEVEL_CASES = [
+    pytest.param(log_level, ["meltano", f"--log-level={log_level}", *_RUN_ARGS], id=log_level)
+    for log_level in ("debug", "info", "warning", "error", "critical")
+]
+
 
 class TestMeltanoRunConfig:
     """Test cases for MeltanoRunConfig.get_command method."""
@@ -65,39 +76,25 @@ class TestMeltanoRunConfig:
             "--refresh-catalog",
         ]
 
-    def test_get_command_with_state_strategy(self) -> None:
+    @pytest.mark.parametrize(
+        ("state_strategy", "expected_tail"),
+        [
+            ("merge", ("--state-strategy=merge",)),
+            ("overwrite", ("--state-strategy=overwrite",)),
+            # The auto strategy should not appear in the command
+            ("auto", ()),
+        ],
+    )
+    def test_get_command_with_state_strategy(
+        self,
+        state_strategy: t.Literal["auto", "merge", "overwrite"],
+        expected_tail: tuple[str, ...],
+    ) -> None:
         """Test get_command with different state strategies."""
-        # Test merge strategy
-        flags = MeltanoRunConfig(state_strategy="merge")
-        command = flags.get_command(run_id="test-run-123")
-
-        assert command == [
-            "meltano",
-            "run",
-            "--run-id=test-run-123",
-            "--state-strategy=merge",
-        ]
-
-        # Test overwrite strategy
-        flags = MeltanoRunConfig(state_strategy="overwrite")
-        command = flags.get_command(run_id="test-run-123")
-
-        assert command == [
-            "meltano",
-            "run",
-            "--run-id=test-run-123",
-            "--state-strategy=overwrite",
-        ]
-
-        # Test auto strategy (should not appear in command)
-        flags = MeltanoRunConfig(state_strategy="auto")
+        flags = MeltanoRunConfig(state_strategy=state_strategy)
         command = flags.get_command(run_id="test-run-123")
 
-        assert command == [
-            "meltano",
-            "run",
-            "--run-id=test-run-123",
-        ]
+        assert command == ["meltano", *_RUN_ARGS, *expected_tail]
 
     def test_get_command_all_flags(self) -> None:
         """Test get_command with all flags enabled."""
@@ -115,19 +112,52 @@ class TestMeltanoRunConfig:
             "--state-strategy=merge",
         ]
 
-    @pytest.mark.parametrize("log_level", ["debug", "info", "warning", "error", "critical"])
-    def test_get_command_all_log_levels(self, log_level: str) -> None:
+    @pytest.mark.parametrize("log_level", [None, "debug", "info"])
+    @pytest.mark.parametrize("full_refresh", [False, True], ids=["incremental", "full-refresh"])
+    @pytest.mark.parametrize("refresh_catalog", [False, True], ids=["cached-catalog", "refresh-catalog"])
+    @pytest.mark.parametrize("state_strategy", ["auto", "merge", "overwrite"])
+    @pytest.mark.parametrize("state_suffix", [None, "prod"])
+    def test_get_command_matrix(
+        self,
+        log_level: str | None,
+        full_refresh: bool,
+        refresh_catalog: bool,
+        state_strategy: t.Literal["auto", "merge", "overwrite"],
+        state_suffix: str | None,
+    ) -> None:
+        """Test get_command with every combination of flags."""
+        flags = MeltanoRunConfig(
+            log_level=log_level,
+            full_refresh=full_refresh,
+            refresh_catalog=refresh_catalog,
+            state_strategy=state_strategy,
+        )
+        command = flags.get_command(run_id="test-run-123", state_suffix=state_suffix)
+
+        # Same ordering as test_get_command_all_flags
+        expected = ["meltano"]
+        if log_level:
+            expected.append(f"--log-level={log_level}")
+        expected += _RUN_ARGS
+        if state_suffix:
+            expected.append(f"--state-id-suffix={state_suffix}")
+        if full_refresh:
+            expected.append("--full-refresh")
+        if refresh_catalog:
+            expected.append("--refresh-catalog")
+        if state_strategy != "auto":
+            expected.append(f"--state-strategy={state_strategy}")
+
+        assert command == expected
+
+    @pytest.mark.parametrize(("log_level", "expected"), _LOG_LEVEL_CASES)
+    def test_get_command_all_log_levels(self, log_level: str, expected: list[str]) -> None:
         """Test get_command with all supported log levels."""
         flags = MeltanoRunConfig(log_level=log_level)
         command = flags.get_command(run_id="test-run-123")
 
         assert f"--log-level={log_level}" in command
-        assert command == [
-            "meltano",
-            f"--log-level={log_level}",
-            "run",
-            "--run-id=test-run-123",
-        ]
+        assert command == expected
 
     def test_select_filter_defaults_to_none(self) -> None:
         """Test that select_filter defaults to None."""
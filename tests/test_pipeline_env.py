@@ -1,4 +1,6 @@
-from unittest.mock import Mock
+import typing as t
+from dataclasses import dataclass
+from types import MappingProxyType
 
 import pytest
 
@@ -19,15 +21,20 @@ from dagster_meltano_pipelines.resources import (
 )
 
 
-@pytest.fixture
+@dataclass(frozen=True)
+class _StubProject:
+    """Stand-in for a MeltanoProject, which only needs a project directory here."""
+
+    project_dir: str
+
+
+@pytest.fixture(scope="module")
 def mock_project() -> MeltanoProject:
-    """Create a mock MeltanoProject for testing."""
-    project = Mock(spec=MeltanoProject)
-    project.project_dir = "/test/meltano/project"
-    return project
+    """Create a stub MeltanoProject for testing."""
+    return t.cast("MeltanoProject", _StubProject(project_dir="/test/meltano/project"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def simple_extractor() -> Extractor:
     """Create a simple extractor for testing."""
     return Extractor(
@@ -40,7 +47,7 @@ def simple_extractor() -> Extractor:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def simple_loader() -> Loader:
     """Create a simple loader for testing."""
     return Loader(
@@ -54,7 +61,7 @@ def simple_loader() -> Loader:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def meltano_config() -> MeltanoConfig:
     """Create a MeltanoConfig for testing."""
     return MeltanoConfig(
@@ -65,7 +72,7 @@ def meltano_config() -> MeltanoConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def simple_pipeline(simple_extractor: Extractor, simple_loader: Loader) -> MeltanoPipeline:
     """Create a simple pipeline for testing."""
     return MeltanoPipeline(
@@ -79,7 +86,7 @@ def simple_pipeline(simple_extractor: Extractor, simple_loader: Loader) -> Melta
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def pipeline_with_config(
     simple_extractor: Extractor,
     simple_loader: Loader,
@@ -96,46 +103,110 @@ def pipeline_with_config(
     )
 
 
-def test_build_pipeline_env_basic(simple_pipeline: MeltanoPipeline, mock_project: MeltanoProject) -> None:
-    """Test basic environment variable building."""
-    base_env = {"EXISTING_VAR": "existing_value", "PATH": "/usr/bin"}
+#: Read-only base environment shared by tests that only need a single base variable
+_BASE_ENV = MappingProxyType({"BASE_VAR": "base_value"})
 
-    result = build_pipeline_env(simple_pipeline, mock_project, base_env=base_env)
+#: Every variable of the simple pipeline's environment when the base environment is empty
+_EXPECTED_EMPTY_BASE_KEYS = frozenset(
+    {
+        "TAP_TEST_API_KEY",
+        "TAP_TEST_BASE_URL",
+        "TARGET_TEST_HOST",
+        "TARGET_TEST_PORT",
+        "TARGET_TEST_DATABASE",
+        "CUSTOM_VAR",
+        "MELTANO_CLI_LOG_FORMAT",
+    },
+)
 
-    # Should contain base environment
-    assert result["EXISTING_VAR"] == "existing_value"
-    assert result["PATH"] == "/usr/bin"
 
-    # Should contain extractor variables
+def _assert_core_pipeline_vars(result: dict[str, str]) -> None:
+    """Assert the extractor, loader and pipeline variables every simple pipeline environment contains."""
     assert result["TAP_TEST_API_KEY"] == "secret123"
-    assert result["TAP_TEST_BASE_URL"] == "https://api.test.com"
-
-    # Should contain loader variables
     assert result["TARGET_TEST_HOST"] == "db.test.com"
-    assert result["TARGET_TEST_PORT"] == "5432"
-    assert result["TARGET_TEST_DATABASE"] == "testdb"
-
-    # Should contain pipeline env variables
     assert result["CUSTOM_VAR"] == "custom_value"
 
 
-def test_build_pipeline_env_removes_meltano_project_root(
+@pytest.mark.parametrize(
+    ("base_env", "ssh_config_path", "expected_present", "expected_absent", "expected_keys"),
+    [
+        pytest.param(
+            {"EXISTING_VAR": "existing_value", "PATH": "/usr/bin"},
+            None,
+            {
+                # Base environment
+                "EXISTING_VAR": "existing_value",
+                "PATH": "/usr/bin",
+                # Extractor and loader variables
+                "TAP_TEST_BASE_URL": "https://api.test.com",
+                "TARGET_TEST_PORT": "5432",
+                "TARGET_TEST_DATABASE": "testdb",
+            },
+            set(),
+            None,
+            id="basic",
+        ),
+        pytest.param(
+            {"MELTANO_PROJECT_ROOT": "/some/other/path", "OTHER_VAR": "other_value"},
+            None,
+            {"OTHER_VAR": "other_value"},
+            {"MELTANO_PROJECT_ROOT"},
+            None,
+            id="removes-meltano-project-root",
+        ),
+        pytest.param(
+            {"BASE_VAR": "base_value"},
+            "/tmp/ssh_config",
+            {"GIT_SSH_COMMAND": "ssh -F /tmp/ssh_config", "BASE_VAR": "base_value"},
+            set(),
+            None,
+            id="ssh-config",
+        ),
+        pytest.param(
+            {"BASE_VAR": "base_value"},
+            None,
+            {"BASE_VAR": "base_value"},
+            {"GIT_SSH_COMMAND"},
+            None,
+            id="no-ssh-config",
+        ),
+        pytest.param(
+            {},
+            None,
+            {"MELTANO_CLI_LOG_FORMAT": "json"},
+            set(),
+            _EXPECTED_EMPTY_BASE_KEYS,
+            id="empty-base-env",
+        ),
+        pytest.param(
+            {"MELTANO_CLI_LOG_FORMAT": "text"},
+            None,
+            # An existing log format is not overridden
+            {"MELTANO_CLI_LOG_FORMAT": "text"},
+            set(),
+            None,
+            id="respects-existing-log-format",
+        ),
+    ],
+)
+def test_build_pipeline_env(
     simple_pipeline: MeltanoPipeline,
     mock_project: MeltanoProject,
+    base_env: dict[str, str],
+    ssh_config_path: str | None,
+    expected_present: dict[str, str],
+    expected_absent: set[str],
+    expected_keys: frozenset[str] | None,
 ) -> None:
-    """Test that MELTANO_PROJECT_ROOT is removed from environment."""
-    base_env = {
-        "MELTANO_PROJECT_ROOT": "/some/other/path",
-        "OTHER_VAR": "other_value",
-    }
-
-    result = build_pipeline_env(simple_pipeline, mock_project, base_env=base_env)
-
-    # MELTANO_PROJECT_ROOT should be removed
-    assert "MELTANO_PROJECT_ROOT" not in result
+    """Test environment variable building from a base environment."""
+    result = build_pipeline_env(simple_pipeline, mock_project, ssh_config_path=ssh_config_path, base_env=base_env)
 
-    # Other variables should remain
-    assert result["OTHER_VAR"] == "other_value"
+    _assert_core_pipeline_vars(result)
+    for key, value in expected_present.items():
+        assert result[key] == value
+    assert expected_absent.isdisjoint(result)
+    if expected_keys is not None:
+        assert result.keys() == expected_keys
 
 
 def test_build_pipeline_env_with_meltano_config(
@@ -143,9 +214,7 @@ def test_build_pipeline_env_with_meltano_config(
     mock_project: MeltanoProject,
 ) -> None:
     """Test environment building with Meltano config."""
-    base_env = {"BASE_VAR": "base_value"}
-
-    result = build_pipeline_env(pipeline_with_config, mock_project, base_env=base_env)
+    result = build_pipeline_env(pipeline_with_config, mock_project, base_env=_BASE_ENV)
 
     # Should contain base environment
     assert result["BASE_VAR"] == "base_value"
@@ -161,22 +230,6 @@ def test_build_pipeline_env_with_meltano_config(
     assert result["PIPELINE_ENV"] == "pipeline_value"
 
 
-def test_build_pipeline_env_with_ssh_config(simple_pipeline: MeltanoPipeline, mock_project: MeltanoProject) -> None:
-    """Test environment building with SSH config path."""
-    ssh_config_path = "/tmp/ssh_config"
-    base_env = {"BASE_VAR": "base_value"}
-
-    result = build_pipeline_env(simple_pipeline, mock_project, ssh_config_path=ssh_config_path, base_env=base_env)
-
-    # Should contain SSH config
-    assert result["GIT_SSH_COMMAND"] == f"ssh -F {ssh_config_path}"
-
-    # Should contain other variables
-    assert result["BASE_VAR"] == "base_value"
-    assert result["TAP_TEST_API_KEY"] == "secret123"
-    assert result["CUSTOM_VAR"] == "custom_value"
-
-
 def test_build_pipeline_env_defaults_to_os_environ(
     simple_pipeline: MeltanoPipeline,
     mock_project: MeltanoProject,
@@ -197,16 +250,25 @@ def test_build_pipeline_env_defaults_to_os_environ(
 
 
 def test_build_pipeline_env_variable_precedence(
-    pipeline_with_config: MeltanoPipeline,
+    simple_extractor: Extractor,
+    simple_loader: Loader,
+    meltano_config: MeltanoConfig,
     mock_project: MeltanoProject,
 ) -> None:
     """Test that variables are applied in the correct precedence order."""
-    # Create a variable that appears in multiple sources
-    pipeline_with_config.env["OVERRIDE_VAR"] = "pipeline_value"
+    # Create a variable that appears in multiple sources, on a pipeline of its own since fixtures are shared
+    pipeline = MeltanoPipeline(
+        id="test-pipeline-precedence",
+        extractor=simple_extractor,
+        loader=simple_loader,
+        meltano_config=meltano_config,
+        env={"PIPELINE_ENV": "pipeline_value", "OVERRIDE_VAR": "pipeline_value"},
+        state_suffix=None,
+    )
 
     base_env = {"OVERRIDE_VAR": "base_value"}
 
-    result = build_pipeline_env(pipeline_with_config, mock_project, base_env=base_env)
+    result = build_pipeline_env(pipeline, mock_project, base_env=base_env)
 
     # Pipeline env should have highest precedence over base env
     assert result["OVERRIDE_VAR"] == "pipeline_value"
@@ -217,25 +279,9 @@ def test_build_pipeline_env_variable_precedence(
     assert result["PIPELINE_ENV"] == "pipeline_value"  # pipeline
 
 
-def test_build_pipeline_env_no_ssh_config(simple_pipeline: MeltanoPipeline, mock_project: MeltanoProject) -> None:
-    """Test environment building without SSH config."""
-    base_env = {"BASE_VAR": "base_value"}
-
-    result = build_pipeline_env(simple_pipeline, mock_project, base_env=base_env)
-
-    # Should not contain GIT_SSH_COMMAND
-    assert "GIT_SSH_COMMAND" not in result
-
-    # Should contain other variables
-    assert result["BASE_VAR"] == "base_value"
-    assert result["TAP_TEST_API_KEY"] == "secret123"
-
-
 def test_build_pipeline_env_no_meltano_config(simple_pipeline: MeltanoPipeline, mock_project: MeltanoProject) -> None:
     """Test environment building without Meltano config."""
-    base_env = {"BASE_VAR": "base_value"}
-
-    result = build_pipeline_env(simple_pipeline, mock_project, base_env=base_env)
+    result = build_pipeline_env(simple_pipeline, mock_project, base_env=_BASE_ENV)
 
     # Should only contain default log format, no other Meltano config variables
     meltano_vars = {key: value for key, value in result.items() if key.startswith("MELTANO_")}
@@ -247,31 +293,6 @@ def test_build_pipeline_env_no_meltano_config(simple_pipeline: MeltanoPipeline,
     assert result["CUSTOM_VAR"] == "custom_value"
 
 
-def test_build_pipeline_env_empty_base_env(simple_pipeline: MeltanoPipeline, mock_project: MeltanoProject) -> None:
-    """Test environment building with empty base environment."""
-    base_env: dict[str, str] = {}
-
-    result = build_pipeline_env(simple_pipeline, mock_project, base_env=base_env)
-
-    # Should contain extractor, loader, and pipeline variables
-    assert result["TAP_TEST_API_KEY"] == "secret123"
-    assert result["TARGET_TEST_HOST"] == "db.test.com"
-    assert result["CUSTOM_VAR"] == "custom_value"
-
-    # Should contain expected variables including default log format
-    expected_keys = {
-        "TAP_TEST_API_KEY",
-        "TAP_TEST_BASE_URL",
-        "TARGET_TEST_HOST",
-        "TARGET_TEST_PORT",
-        "TARGET_TEST_DATABASE",
-        "CUSTOM_VAR",
-        "MELTANO_CLI_LOG_FORMAT",
-    }
-    assert set(result.keys()) == expected_keys
-    assert result["MELTANO_CLI_LOG_FORMAT"] == "json"
-
-
 def test_build_pipeline_env_preserves_base_env_copy(
     simple_pipeline: MeltanoPipeline,
     mock_project: MeltanoProject,
@@ -290,31 +311,14 @@ def test_build_pipeline_env_preserves_base_env_copy(
     assert result["ORIGINAL_VAR"] == "original_value"
 
 
-def test_build_pipeline_env_respects_existing_log_format(
-    simple_pipeline: MeltanoPipeline,
-    mock_project: MeltanoProject,
-) -> None:
-    """Test that existing MELTANO_CLI_LOG_FORMAT is not overridden."""
-    base_env = {"MELTANO_CLI_LOG_FORMAT": "text"}
-
-    result = build_pipeline_env(simple_pipeline, mock_project, base_env=base_env)
-
-    # Should preserve existing log format
-    assert result["MELTANO_CLI_LOG_FORMAT"] == "text"
-
-
 def test_build_pipeline_env_with_select_filter(simple_pipeline: MeltanoPipeline, mock_project: MeltanoProject) -> None:
     """Test environment building with select_filter in runtime config."""
     select_filter = ["table1", "table2.column1", "table3.*"]
     flags = MeltanoRunConfig(select_filter=select_filter)
-    base_env = {"BASE_VAR": "base_value"}
-
-    result = build_pipeline_env(simple_pipeline, mock_project, base_env=base_env, flags=flags)
+    result = build_pipeline_env(simple_pipeline, mock_project, base_env=_BASE_ENV, flags=flags)
 
     # Should contain select_filter as JSON
-    import json
-
-    assert result["TAP_TEST__SELECT_FILTER"] == json.dumps(select_filter)
+    assert result["TAP_TEST__SELECT_FILTER"] == '["table1","table2.column1","table3.*"]'
 
     # Should contain other variables
     assert result["BASE_VAR"] == "base_value"
@@ -328,9 +332,7 @@ def test_build_pipeline_env_without_select_filter(
 ) -> None:
     """Test environment building without select_filter in runtime config."""
     flags = MeltanoRunConfig()
-    base_env = {"BASE_VAR": "base_value"}
-
-    result = build_pipeline_env(simple_pipeline, mock_project, base_env=base_env, flags=flags)
+    result = build_pipeline_env(simple_pipeline, mock_project, base_env=_BASE_ENV, flags=flags)
 
     # Should not contain TAP_TEST__SELECT_FILTER
     assert "TAP_TEST__SELECT_FILTER" not in result
@@ -347,9 +349,7 @@ def test_build_pipeline_env_with_none_select_filter(
 ) -> None:
     """Test environment building with select_filter explicitly set to None."""
     flags = MeltanoRunConfig(select_filter=None)
-    base_env = {"BASE_VAR": "base_value"}
-
-    result = build_pipeline_env(simple_pipeline, mock_project, base_env=base_env, flags=flags)
+    result = build_pipeline_env(simple_pipeline, mock_project, base_env=_BASE_ENV, flags=flags)
 
     # Should not contain TAP_TEST__SELECT_FILTER
     assert "TAP_TEST__SELECT_FILTER" not in result
@@ -367,14 +367,9 @@ def test_build_pipeline_env_with_empty_select_filter(
     """Test environment building with empty select_filter list."""
     select_filter: list[str] = []
     flags = MeltanoRunConfig(select_filter=select_filter)
-    base_env = {"BASE_VAR": "base_value"}
-
-    result = build_pipeline_env(simple_pipeline, mock_project, base_env=base_env, flags=flags)
+    result = build_pipeline_env(simple_pipeline, mock_project, base_env=_BASE_ENV, flags=flags)
 
     # Should contain select_filter as JSON even if empty
-    import json
-
-    assert result["TAP_TEST__SELECT_FILTER"] == json.dumps(select_filter)
     assert result["TAP_TEST__SELECT_FILTER"] == "[]"
 
     # Should contain other variables
@@ -106,6 +106,32 @@ def test_process_metric_log_with_metric_info(mock_context: MagicMock) -> None:
     assert "METRIC: metric_type='counter' value=1000 stream='users'" in debug_call_arg
 
 
+def test_process_warning_metric_log_drops_metric_info(mock_context: MagicMock) -> None:
+    """Test that a warning-level METRIC log is collected without its metric_info."""
+    log_line = orjson.dumps(
+        {
+            "level": "warning",
+            "event": "METRIC",
+            "metric_info": {
+                "metric_type": "timer",
+                "value": 3.5,
+            },
+            "plugin": "tap-test",
+        },
+    )
+    result = process_meltano_stdout(mock_context, [log_line])
+
+    assert result.error_logs == []
+    assert result.warning_logs == [
+        {
+            "level": "warning",
+            "event": "METRIC",
+            "plugin": "tap-test",
+        },
+    ]
+    mock_context.log.debug.assert_called_once()
+
+
 def test_process_metric_log_without_metric_info(mock_context: MagicMock) -> None:
     """Test processing METRIC log without metric_info."""
     log_line = orjson.dumps(
@@ -199,6 +225,38 @@ def test_process_malformed_json(mock_context: MagicMock) -> None:
     assert result.warning_logs == []
 
 
+def test_process_non_object_json_as_text(mock_context: MagicMock) -> None:
+    """Test that JSON values other than objects are logged as raw text."""
+    lines = [b'["not", "a", "log", "record"]\n', b"42\n"]
+
+    result = process_meltano_stdout(mock_context, lines)
+
+    assert mock_context.log.info.call_count == 2
+    mock_context.log.info.assert_any_call('["not", "a", "log", "record"]')
+    mock_context.log.info.assert_any_call("42")
+    mock_context.log.log.assert_not_called()
+    assert result.error_logs == []
+
+
+def test_process_blank_lines_skipped(mock_context: MagicMock) -> None:
+    """Test that blank lines are not logged."""
+    lines = [b"\n", b"   \n", b"Plain text log message\n"]
+
+    process_meltano_stdout(mock_context, lines)
+
+    mock_context.log.info.assert_called_once_with("Plain text log message")
+
+
+def test_process_invalid_utf8(mock_context: MagicMock) -> None:
+    """Test that undecodable bytes are replaced instead of failing the run."""
+    lines = [b"Error: bad byte \xff\n"]
+
+    result = process_meltano_stdout(mock_context, lines)
+
+    mock_context.log.info.assert_called_once_with("Error: bad byte \ufffd")
+    assert result.error_logs == ["Error: bad byte \ufffd"]
+
+
 def test_process_case_insensitive_error_detection(mock_context: MagicMock) -> None:
     """Test that error detection is case-insensitive."""
     lines = [
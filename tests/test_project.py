@@ -0,0 +1,152 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from dagster_meltano_pipelines.errors import DagsterMeltanoProjectNotFoundError
+from dagster_meltano_pipelines.project import MeltanoProject
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path) -> Path:
+    """Create a minimal Meltano project with locked, custom and included plugins."""
+    meltano_yml = {
+        "project_id": "test",
+        "include_paths": ["./extra.meltano.yml"],
+        "plugins": {
+            "extractors": [
+                {"name": "tap-locked", "variant": "meltanolabs", "pip_url": "tap-locked==1.0"},
+                {
+                    "name": "tap-custom",
+                    "namespace": "tap_custom",
+                    "executable": "tap-custom",
+                    "config": {"batch_size": 1},
+                },
+            ],
+        },
+    }
+    extra_meltano_yml = {
+        "plugins": {
+            "loaders": [
+                {"name": "target-locked", "variant": "meltanolabs"},
+            ],
+        },
+    }
+    (tmp_path / "meltano.yml").write_text(yaml.safe_dump(meltano_yml))
+    (tmp_path / "extra.meltano.yml").write_text(yaml.safe_dump(extra_meltano_yml))
+
+    for plugin_type, name in (("extractors", "tap-locked"), ("loaders", "target-locked")):
+        lock_dir = tmp_path / "plugins" / plugin_type
+        lock_dir.mkdir(parents=True)
+        lock_file = lock_dir / f"{name}--meltanolabs.lock"
+        lock_file.write_text(
+            json.dumps(
+                {
+                    "plugin_type": plugin_type,
+                    "name": name,
+                    "variant": "meltanolabs",
+                    "pip_url": f"{name}==0.1",
+                    "settings": [{"name": "api_key", "kind": "password"}],
+                },
+            ),
+        )
+
+    return tmp_path
+
+
+def test_project_reads_plugin_definitions(project_dir: Path) -> None:
+    project = MeltanoProject(project_dir)
+
+    assert project.project_dir == project_dir
+    assert set(project.plugins) == {
+        ("extractors", "tap-locked"),
+        ("extractors", "tap-custom"),
+        ("loaders", "target-locked"),
+    }
+
+    # Locked plugins merge the lock file with the meltano.yml entry, which takes precedence
+    tap_locked = project.plugins["extractors", "tap-locked"]
+    assert tap_locked["pip_url"] == "tap-locked==1.0"
+    assert tap_locked["settings"] == [{"name": "api_key", "kind": "password"}]
+
+    # Custom plugins are defined inline
+    assert project.plugins["extractors", "tap-custom"]["namespace"] == "tap_custom"
+
+    # Plugins from include_paths are read too
+    assert project.plugins["loaders", "target-locked"]["pip_url"] == "target-locked==0.1"
+
+
+def test_project_not_found(tmp_path: Path) -> None:
+    with pytest.raises(DagsterMeltanoProjectNotFoundError):
+        MeltanoProject(tmp_path / "missing")
+
+
+def test_project_rereads_changed_files(project_dir: Path) -> None:
+    assert ("loaders", "target-jsonl") not in MeltanoProject(project_dir).plugins
+
+    extra_meltano_yml = project_dir / "extra.meltano.yml"
+    stat = extra_meltano_yml.stat()
+    extra_meltano_yml.write_text(
+        yaml.safe_dump(
+            {"plugins": {"loaders": [{"name": "target-jsonl", "namespace": "target_jsonl"}]}},
+        ),
+    )
+    os.utime(extra_meltano_yml, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert ("loaders", "target-jsonl") in MeltanoProject(project_dir).plugins
+
+
+def test_project_rereads_changed_lock_files(project_dir: Path) -> None:
+    assert MeltanoProject(project_dir).plugins["extractors", "tap-locked"]["settings"] == [
+        {"name": "api_key", "kind": "password"},
+    ]
+
+    lock_file = project_dir / "plugins" / "extractors" / "tap-locked--meltanolabs.lock"
+    stat = lock_file.stat()
+    lock_file.write_text(json.dumps({"name": "tap-locked", "settings": []}))
+    os.utime(lock_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert MeltanoProject(project_dir).plugins["extractors", "tap-locked"]["settings"] == []
+
+
+def test_project_plugins_read_only(project_dir: Path) -> None:
+    project = MeltanoProject(project_dir)
+    with pytest.raises(TypeError):
+        project.plugins["loaders", "target-jsonl"] = {"name": "target-jsonl"}  # type: ignore[index]
+
+
+def test_project_reads_lock_files_on_access(project_dir: Path) -> None:
+    (project_dir / "plugins" / "loaders" / "target-locked--meltanolabs.lock").unlink()
+    project = MeltanoProject(project_dir)
+
+    assert ("loaders", "target-locked") in project.plugins
+    assert project.plugins["extractors", "tap-locked"]["pip_url"] == "tap-locked==1.0"
+    with pytest.raises(FileNotFoundError):
+        project.plugins["loaders", "target-locked"]
+
+
+def test_project_compares_without_reading_lock_files(project_dir: Path) -> None:
+    (project_dir / "plugins" / "loaders" / "target-locked--meltanolabs.lock").unlink()
+
+    assert MeltanoProject(project_dir) == MeltanoProject(project_dir)
+    assert repr(MeltanoProject(project_dir).plugins) == (
+        "MeltanoPluginDefinitions(["
+        "('extractors', 'tap-locked'), ('extractors', 'tap-custom'), ('loaders', 'target-locked')"
+        "])"
+    )
+
+
+def test_project_plugins_do_not_share_nested_meltano_yml_values(project_dir: Path) -> None:
+    MeltanoProject(project_dir).plugins["extractors", "tap-custom"]["config"]["batch_size"] = 999
+
+    assert MeltanoProject(project_dir).plugins["extractors", "tap-custom"]["config"] == {"batch_size": 1}
+
+
+def test_project_plugins_do_not_share_nested_lock_file_values(project_dir: Path) -> None:
+    MeltanoProject(project_dir).plugins["extractors", "tap-locked"]["settings"].append({"name": "extra"})
+
+    assert MeltanoProject(project_dir).plugins["extractors", "tap-locked"]["settings"] == [
+        {"name": "api_key", "kind": "password"},
+    ]
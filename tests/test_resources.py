@@ -6,6 +6,7 @@ from dagster_meltano_pipelines.resources import (
     ELTConfig,
     Extractor,
     ExtractorConfig,
+    Loader,
     MeltanoConfig,
     StateBackendConfig,
     VenvConfig,
@@ -69,14 +70,14 @@ def test_plugin_as_env(extractor: Extractor, monkeypatch: pytest.MonkeyPatch) ->
     monkeypatch.setenv("BAZ", "baz")
     assert extractor.as_env() == {
         "TAP_TEST_API_KEY": "s3c3r3t",
-        "TAP_TEST_MAPPING": '{"foo": "bar", "baz": "qux"}',
-        "TAP_TEST_MAPPING_WITH_ENV_VARS": '{"foo": "foo", "baz": "baz"}',
-        "TAP_TEST_SEQUENCE": "[1, 2, 3]",
-        "TAP_TEST_SEQUENCE_WITH_ENV_VARS": '["foo", "bar", "baz"]',
-        "TAP_TEST_NESTED_ENV_VARS": '{"foo": [{"bar": {"baz": "baz", "qux": "qux"}}]}',
+        "TAP_TEST_MAPPING": '{"foo":"bar","baz":"qux"}',
+        "TAP_TEST_MAPPING_WITH_ENV_VARS": '{"foo":"foo","baz":"baz"}',
+        "TAP_TEST_SEQUENCE": "[1,2,3]",
+        "TAP_TEST_SEQUENCE_WITH_ENV_VARS": '["foo","bar","baz"]',
+        "TAP_TEST_NESTED_ENV_VARS": '{"foo":[{"bar":{"baz":"baz","qux":"qux"}}]}',
         "TAP_TEST_FROM_DAGSTER": "from_dagster",
         "TAP_TEST__CATALOG": "catalog.json",
-        "TAP_TEST__SELECT": '["foo.*", "baz.*"]',
+        "TAP_TEST__SELECT": '["foo.*","baz.*"]',
     }
 
 
@@ -91,3 +92,86 @@ def test_meltano_config_as_env(meltano_config: MeltanoConfig, monkeypatch: pytes
         "MELTANO_CLI_LOG_FORMAT": "json",
         "MELTANO_ELT_BUFFER_SIZE": "104857600",
     }
+
+
+def test_plugin_as_env_non_string_keys() -> None:
+    extractor = Extractor(
+        name="tap-test",
+        config=ExtractorConfig(  # type: ignore[call-arg]
+            mapping={1: "one", 2: "two"},
+        ),
+    )
+    assert extractor.as_env() == {
+        "TAP_TEST_MAPPING": '{"1":"one","2":"two"}',
+    }
+
+
+def test_plugin_as_env_builtin_subclasses() -> None:
+    class Name(str):
+        pass
+
+    class Port(int):
+        pass
+
+    class Ratio(float):
+        pass
+
+    extractor = Extractor(
+        name="tap-test",
+        config=ExtractorConfig(  # type: ignore[call-arg]
+            names=[Name("x"), "y"],
+            ports={"primary": Port(5432)},
+            ratios=[Ratio(1.5)],
+        ),
+    )
+    assert extractor.as_env() == {
+        "TAP_TEST_NAMES": '["x","y"]',
+        "TAP_TEST_PORTS": '{"primary":5432}',
+        "TAP_TEST_RATIOS": "[1.5]",
+    }
+
+
+def test_plugin_as_env_values_beyond_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FOO", "foo")
+    extractor = Extractor(
+        name="tap-test",
+        config=ExtractorConfig(  # type: ignore[call-arg]
+            ids=[2**70, dg.EnvVar("FOO")],
+            limits={"lower": float("-inf"), "upper": float("inf"), "target": float("nan"), "unset": None},
+        ),
+    )
+    assert extractor.as_env() == {
+        "TAP_TEST_IDS": '[1180591620717411303424,"foo"]',
+        "TAP_TEST_LIMITS": '{"lower":-Infinity,"upper":Infinity,"target":NaN,"unset":null}',
+    }
+
+
+def test_plugin_env_prefix(extractor: Extractor) -> None:
+    assert extractor.env_prefix == "TAP_TEST"
+    # The prefix is derived, so it must not end up in the resource configuration
+    assert "env_prefix" not in dict(extractor)
+    assert Loader(name="target-my-db", config=None).env_prefix == "TARGET_MY_DB"
+
+
+def test_meltano_config_as_env_big_integers() -> None:
+    meltano_config = MeltanoConfig(  # type: ignore[call-arg]
+        limits={"big": 2**64},
+    )
+    assert meltano_config.as_env() == {
+        "MELTANO_LIMITS": '{"big":18446744073709551616}',
+    }
+
+
+def test_meltano_config_as_env_extra_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SEND_ANONYMOUS_USAGE_STATS", "false")
+    meltano_config = MeltanoConfig(  # type: ignore[call-arg]
+        cli=CLIConfig(log_level="info", log_format=None),
+        project_readonly=True,
+        send_anonymous_usage_stats=dg.EnvVar("SEND_ANONYMOUS_USAGE_STATS"),
+        default_environment=None,
+    )
+    assert meltano_config.as_env() == {
+        "MELTANO_CLI_LOG_LEVEL": "info",
+        "MELTANO_PROJECT_READONLY": "True",
+        "MELTANO_SEND_ANONYMOUS_USAGE_STATS": "false",
+    }
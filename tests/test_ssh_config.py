@@ -238,3 +238,10 @@ def test_setup_ssh_config_literal_newline_replacement(mock_context: Mock) -> Non
         # Verify it contains actual newlines, not literal \n
         assert "\\n" not in key_content
         assert "\n" in key_content
+
+
+def test_setup_ssh_config_file_permissions(mock_context: Mock, sample_ssh_keys: list[str]) -> None:
+    """Test that the SSH config file is only accessible by its owner."""
+    with setup_ssh_config(mock_context, sample_ssh_keys) as ssh_config_path:
+        assert ssh_config_path is not None
+        assert os.stat(ssh_config_path).st_mode & 0o777 == 0o600